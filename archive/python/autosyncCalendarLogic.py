@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import stat
 import platform
 from ics import Calendar
 from git import Repo, GitCommandError
@@ -40,37 +41,26 @@ def check_git_installed():
         logging.info(f"Git found at {git_path}")
         return True
     else:
-        logging.warning("Git not found. Attempting to download portable Git.")
+        logging.warning("Git not found.")
         return False
 
 def download_portable_git():
-    os_name = platform.system().lower()
-    git_filename = None
-    git_url = None
-
-    if os_name == 'windows':
-        git_url = 'https://github.com/git-for-windows/git/releases/download/v2.45.1.windows.1/PortableGit-2.45.1-64-bit.7z.exe'
-        git_filename = 'PortableGit-2.45.1-64-bit.7z.exe'
-    elif os_name == 'linux':
-        git_url = 'https://github.com/git/git/archive/refs/tags/v2.40.0.tar.gz'
-        git_filename = 'git-2.40.0.tar.gz'
-    elif os_name == 'darwin':
-        git_url = 'https://sourceforge.net/projects/git-osx-installer/files/git-2.40.0-intel-universal-mavericks.dmg/download'
-        git_filename = 'git-2.40.0-intel-universal-mavericks.dmg'
-    else:
-        logging.error(f"Unsupported OS: {os_name}")
-        return False
+    # The portable Git download is Windows-only and opt-in; servers are expected to have git installed
+    if platform.system() != 'Windows' or os.getenv('SYNC_DOWNLOAD_PORTABLE_GIT') != '1':
+        logging.error("Git is required. Install Git, or set SYNC_DOWNLOAD_PORTABLE_GIT=1 on Windows to download portable Git.")
+        exit(2)
 
-    if not git_url or not git_filename:
-        logging.error("Invalid Git download URL or filename.")
-        return False
+    git_url = 'https://github.com/git-for-windows/git/releases/download/v2.45.1.windows.1/PortableGit-2.45.1-64-bit.7z.exe'
+    git_filename = 'PortableGit-2.45.1-64-bit.7z.exe'
 
     try:
         response = requests.get(git_url, stream=True)
         if response.status_code == 200:
-            with open(git_filename, 'wb') as file:
-                for chunk in tqdm(response.iter_content(chunk_size=8192), desc='Downloading Git', unit='B', unit_scale=True, unit_divisor=1024):
-                    file.write(chunk)
+            response.raw.decode_content = True
+            total = int(response.headers.get('Content-Length', 0)) or None
+            # Progress is driven off each 1 MiB read rather than per small chunk
+            with open(git_filename, 'wb') as file, tqdm.wrapattr(response.raw, 'read', total=total, desc='Downloading Git') as raw:
+                shutil.copyfileobj(raw, file, length=1024 * 1024)
             logging.info(f"Downloaded Git: {git_filename}")
             return True
         else:
@@ -86,13 +76,10 @@ def is_repo_up_to_date(repo_path):
             logging.error(f"Repository path does not exist: {repo_path}")
             return False
         repo = Repo(repo_path)
-        origin = repo.remotes.origin
-        origin.fetch()  # Fetch latest commits
+        # ls-remote only transfers the ref list, unlike fetch which downloads new objects
+        remote_sha = repo.git.ls_remote('origin', 'refs/heads/main').split()[0]
 
-        local_commit = repo.head.commit
-        remote_commit = repo.commit('origin/main')
-
-        if local_commit.hexsha == remote_commit.hexsha:
+        if repo.head.commit.hexsha == remote_sha:
             logging.info("Local repository is up-to-date.")
             return True
         else:
@@ -105,15 +92,28 @@ def is_repo_up_to_date(repo_path):
         logging.error(f"Error checking repository status: {e}")
         return False
 
+def pull_latest_changes(repo_path):
+    try:
+        repo = Repo(repo_path)
+        repo.remotes.origin.pull('main')
+        logging.info("Pulled latest changes from origin/main.")
+        return True
+    except GitCommandError as e:
+        logging.error(f"Git command error pulling latest changes: {e}")
+        return False
+    except Exception as e:
+        logging.error(f"Error pulling latest changes: {e}")
+        return False
+
+def _chmod_retry(func, path, exc_info):
+    # Read-only files (e.g. git pack objects on Windows) only get chmodded when removal fails
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
 def delete_and_reclone_repo(repo_path):
     try:
         if os.path.exists(repo_path):
-            for root, dirs, files in os.walk(repo_path):
-                for dir in dirs:
-                    os.chmod(os.path.join(root, dir), 0o777)
-                for file in files:
-                    os.chmod(os.path.join(root, file), 0o777)
-            shutil.rmtree(repo_path)
+            shutil.rmtree(repo_path, onerror=_chmod_retry)
             logging.info(f"Deleted existing repository at {repo_path}")
     except PermissionError as e:
         logging.error(f"Permission error deleting repository: {e}")
@@ -139,11 +139,15 @@ def clone_repository():
                     pbar.update(cur_count - pbar.n)
                     pbar.set_postfix_str(message)
 
-                Repo.clone_from(GITHUB_REPO, repo_path, progress=update_pbar)
+                # Only the current tree is needed to edit the page and push one commit on top of it
+                Repo.clone_from(GITHUB_REPO, repo_path, progress=update_pbar,
+                                multi_options=['--depth=1', '--single-branch', '--branch=main', '--no-tags'])
             logging.info(f"Repository cloned to {repo_path}")
         else:
             if not is_repo_up_to_date(repo_path):
-                delete_and_reclone_repo(repo_path)
+                # Only fall back to a full reclone when an in-place pull is not possible
+                if not pull_latest_changes(repo_path):
+                    delete_and_reclone_repo(repo_path)
             else:
                 logging.info(f"Repository already exists at {repo_path}")
         os.chdir(repo_path)
@@ -279,6 +283,14 @@ def update_html_file(event_html):
     except IOError as e:
         logging.error(f"Error updating HTML file: {e}")
 
+def html_file_changed(repo):
+    # Diffing the one file we edit avoids a full-worktree status scan
+    try:
+        repo.git.diff('--quiet', 'HEAD', '--', EVENTS_HTML_FILE)
+        return False
+    except GitCommandError:
+        return True
+
 def push_to_github():
     try:
         logging.info("Pushing changes to GitHub...")
@@ -286,17 +298,9 @@ def push_to_github():
         origin = repo.remote(name='origin')
         origin.set_url(f'https://{GITHUB_TOKEN}@github.com/dareaquatics/dare-website.git')
 
-        if repo.is_dirty(untracked_files=True):
-            with tqdm(total=100, desc='Committing changes') as pbar:
-                def update_commit_pbar(cur_count, max_count=None, message=''):
-                    if max_count:
-                        pbar.total = max_count
-                    pbar.update(cur_count - pbar.n)
-                    pbar.set_postfix_str(message)
-
-                repo.git.add(EVENTS_HTML_FILE)
-                repo.index.commit('automated commit: sync TeamUnify calendar [skip ci]')
-                pbar.update(100)
+        if html_file_changed(repo):
+            repo.git.add(EVENTS_HTML_FILE)
+            repo.index.commit('automated commit: sync TeamUnify calendar [skip ci]')
 
             with tqdm(total=100, desc='Pushing changes') as pbar:
                 def update_push_pbar(op_code, cur_count, max_count=None, message=''):
@@ -2,15 +2,27 @@
 
 import os
 import shutil
+import stat
 import platform
+import asyncio
+import html
+import concurrent.futures
+import json
+import multiprocessing
+import mmap
+import tempfile
+import aiohttp
 import cloudscraper
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.etree
+import lxml.html
 from datetime import datetime
 from git import Repo, GitCommandError
 import logging
 import colorlog
 import re
 import requests
+from urllib3.util.retry import Retry
 from tqdm import tqdm
 
 # Constants
@@ -18,6 +30,24 @@ GITHUB_REPO = 'https://github.com/dareaquatics/dare-website'
 NEWS_URL = 'https://www.gomotionapp.com/team/cadas/page/news'
 REPO_NAME = 'dare-website'
 NEWS_HTML_FILE = 'news.html'
+NEWS_CACHE_FILE = '.news_cache.json'
+NEWS_STATE_FILE = '.news_sync_state.json'
+# Bump whenever the article formatting or the cached article dict shape changes, so stale entries get rebuilt
+CACHE_VERSION = 1
+MAX_CONCURRENT_FETCHES = 10
+COPY_CHUNK_SIZE = 1024 * 1024
+
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+STRIPPED_ATTRIBUTES = ['style', 'class', 'id', 'width', 'height', 'align', 'border', 'bgcolor']
+
+# Only the article cards and article bodies are needed; skip parsing the rest of each page.
+# The class is matched per word so multi-class divs such as "Item Supplement" still get through.
+_ITEM_STRAINER = SoupStrainer('div', class_=lambda c: c is not None and 'Item' in c.split())
+_NEWSITEM_STRAINER = SoupStrainer('div', class_=lambda c: c is not None and 'NewsItem' in c.split())
+
+# Patterns used while formatting article content, compiled once at import time
+_RE_WS = re.compile(r'\s+')
+_RE_NUM_ITEM = re.compile(r'\d+\. ')
 
 # GitHub Token is expected to be in environment variable 'PAT_TOKEN'
 GITHUB_TOKEN = os.getenv('PAT_TOKEN')
@@ -36,6 +66,13 @@ handler.setFormatter(colorlog.ColoredFormatter(
 ))
 logging.basicConfig(level=logging.DEBUG, handlers=[handler])
 
+# Shared HTTP session so TeamUnify and GitHub API requests reuse pooled keep-alive connections.
+# cloudscraper mounts its own TLS adapters, so retries are configured on those rather than replacing them.
+# 429 and 503 are left out: cloudscraper must see those responses to detect and solve Cloudflare challenges.
+_SCRAPER = cloudscraper.create_scraper()
+for _adapter in _SCRAPER.adapters.values():
+    _adapter.max_retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 504))
+
 
 def check_git_installed():
     git_path = shutil.which("git")
@@ -43,38 +80,27 @@ def check_git_installed():
         logging.info(f"Git found at {git_path}")
         return True
     else:
-        logging.warning("Git not found. Attempting to download portable Git.")
+        logging.warning("Git not found.")
         return False
 
 
 def download_portable_git():
-    os_name = platform.system().lower()
-    git_filename = None
-    git_url = None
-
-    if os_name == 'windows':
-        git_url = 'https://github.com/git-for-windows/git/releases/download/v2.45.1.windows.1/PortableGit-2.45.1-64-bit.7z.exe'
-        git_filename = 'PortableGit-2.45.1-64-bit.7z.exe'
-    elif os_name == 'linux':
-        git_url = 'https://github.com/git/git/archive/refs/tags/v2.40.0.tar.gz'
-        git_filename = 'git-2.40.0.tar.gz'
-    elif os_name == 'darwin':
-        git_url = 'https://sourceforge.net/projects/git-osx-installer/files/git-2.40.0-intel-universal-mavericks.dmg/download'
-        git_filename = 'git-2.40.0-intel-universal-mavericks.dmg'
-    else:
-        logging.error(f"Unsupported OS: {os_name}")
-        return False
+    # The portable Git download is Windows-only and opt-in; servers are expected to have git installed
+    if platform.system() != 'Windows' or os.getenv('SYNC_DOWNLOAD_PORTABLE_GIT') != '1':
+        logging.error("Git is required. Install Git, or set SYNC_DOWNLOAD_PORTABLE_GIT=1 on Windows to download portable Git.")
+        exit(2)
 
-    if not git_url or not git_filename:
-        logging.error("Invalid Git download URL or filename.")
-        return False
+    git_url = 'https://github.com/git-for-windows/git/releases/download/v2.45.1.windows.1/PortableGit-2.45.1-64-bit.7z.exe'
+    git_filename = 'PortableGit-2.45.1-64-bit.7z.exe'
 
     try:
         response = requests.get(git_url, stream=True)
         if response.status_code == 200:
-            with open(git_filename, 'wb') as file:
-                for chunk in tqdm(response.iter_content(chunk_size=8192), desc='Downloading Git', unit='B', unit_scale=True, unit_divisor=1024):
-                    file.write(chunk)
+            response.raw.decode_content = True
+            total = int(response.headers.get('Content-Length', 0)) or None
+            # Progress is driven off each 1 MiB read rather than per small chunk
+            with open(git_filename, 'wb') as file, tqdm.wrapattr(response.raw, 'read', total=total, desc='Downloading Git') as raw:
+                shutil.copyfileobj(raw, file, length=1024 * 1024)
             logging.info(f"Downloaded Git: {git_filename}")
             return True
         else:
@@ -91,13 +117,10 @@ def is_repo_up_to_date(repo_path):
             logging.error(f"Repository path does not exist: {repo_path}")
             return False
         repo = Repo(repo_path)
-        origin = repo.remotes.origin
-        origin.fetch()  # Fetch latest commits
-
-        local_commit = repo.head.commit
-        remote_commit = repo.commit('origin/main')
+        # ls-remote only transfers the ref list, unlike fetch which downloads new objects
+        remote_sha = repo.git.ls_remote('origin', 'refs/heads/main').split()[0]
 
-        if local_commit.hexsha == remote_commit.hexsha:
+        if repo.head.commit.hexsha == remote_sha:
             logging.info("Local repository is up-to-date.")
             return True
         else:
@@ -111,15 +134,30 @@ def is_repo_up_to_date(repo_path):
         return False
 
 
+def pull_latest_changes(repo_path):
+    try:
+        repo = Repo(repo_path)
+        repo.remotes.origin.pull('main')
+        logging.info("Pulled latest changes from origin/main.")
+        return True
+    except GitCommandError as e:
+        logging.error(f"Git command error pulling latest changes: {e}")
+        return False
+    except Exception as e:
+        logging.error(f"Error pulling latest changes: {e}")
+        return False
+
+
+def _chmod_retry(func, path, exc_info):
+    # Read-only files (e.g. git pack objects on Windows) only get chmodded when removal fails
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
 def delete_and_reclone_repo(repo_path):
     try:
         if os.path.exists(repo_path):
-            for root, dirs, files in os.walk(repo_path):
-                for dir in dirs:
-                    os.chmod(os.path.join(root, dir), 0o777)
-                for file in files:
-                    os.chmod(os.path.join(root, file), 0o777)
-            shutil.rmtree(repo_path)
+            shutil.rmtree(repo_path, onerror=_chmod_retry)
             logging.info(f"Deleted existing repository at {repo_path}")
     except PermissionError as e:
         logging.error(f"Permission error deleting repository: {e}")
@@ -146,11 +184,15 @@ def clone_repository():
                     pbar.update(cur_count - pbar.n)
                     pbar.set_postfix_str(message)
 
-                Repo.clone_from(GITHUB_REPO, repo_path, progress=update_pbar)
+                # Only the current tree is needed to edit the page and push one commit on top of it
+                Repo.clone_from(GITHUB_REPO, repo_path, progress=update_pbar,
+                                multi_options=['--depth=1', '--single-branch', '--branch=main', '--no-tags'])
             logging.info(f"Repository cloned to {repo_path}")
         else:
             if not is_repo_up_to_date(repo_path):
-                delete_and_reclone_repo(repo_path)
+                # Only fall back to a full reclone when an in-place pull is not possible
+                if not pull_latest_changes(repo_path):
+                    delete_and_reclone_repo(repo_path)
             else:
                 logging.info(f"Repository already exists at {repo_path}")
         os.chdir(repo_path)
@@ -168,7 +210,7 @@ def check_github_token_validity():
         }
         repo_path = GITHUB_REPO.replace("https://github.com/", "")
         api_url = f'https://api.github.com/repos/{repo_path}'
-        response = requests.get(api_url, headers=headers)
+        response = _SCRAPER.get(api_url, headers=headers)
         if response.status_code == 200:
             logging.info("GitHub token is valid.")
         else:
@@ -182,15 +224,14 @@ def check_github_token_validity():
 def fetch_news():
     try:
         logging.info("Fetching news from TeamUnify using bypass...")
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(NEWS_URL)
+        response = _SCRAPER.get(NEWS_URL)
         response.raise_for_status()
 
         logging.debug(f"Fetched HTML content: {response.text[:2000]}")
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_ITEM_STRAINER)
 
-        news_items = []
+        listing = []
 
         articles = soup.find_all('div', class_='Item')
         logging.debug(f"Found {len(articles)} articles in total")
@@ -200,22 +241,52 @@ def fetch_news():
                 logging.debug("Skipping Supplement item")
                 continue
 
-            try:
-                link_element = article.find('a', href=True)
-                article_url = f"https://www.gomotionapp.com{link_element['href']}" if link_element else None
+            link_element = article.find('a', href=True)
+            if link_element:
+                listing.append((f"https://www.gomotionapp.com{link_element['href']}", parse_listing_timestamp(article)))
+            else:
+                logging.warning("Article URL not found for listing item")
+
+        cache_data = load_json_file(NEWS_CACHE_FILE)
+        if cache_data.get('version') == CACHE_VERSION:
+            cache = cache_data.get('articles', {})
+            last_seen_max_ts = load_json_file(NEWS_STATE_FILE).get('last_seen_max_ts', 0)
+        else:
+            if cache_data:
+                logging.info("Article cache was written by a different format version. Discarding it.")
+            cache = {}
+            last_seen_max_ts = 0
 
-                if article_url:
-                    article_details = fetch_article_content(article_url)
-                    if article_details:
-                        news_items.append(article_details)
-                else:
-                    logging.warning(f"Article URL not found for article with title: {title}")
+        # Articles published at or before the last successful sync are served straight from the cache
+        fetch_urls = [url for url, ts in listing if ts is None or ts > last_seen_max_ts or url not in cache]
+        logging.info(f"Fetching {len(fetch_urls)} articles, reusing {len(listing) - len(fetch_urls)} cached articles")
 
-            except Exception as e:
-                logging.error(f"Error processing article: {e}")
+        # The cloudscraper request above solves any JS challenge; reuse its cookies and headers
+        # so the article requests can go out concurrently over aiohttp.
+        results = asyncio.run(fetch_all_articles(fetch_urls, dict(_SCRAPER.headers), _SCRAPER.cookies.get_dict(), cache))
+        fetched = dict(zip(fetch_urls, results))
 
-        news_items.sort(
-            key=lambda x: datetime.strptime(x['date'], '%B %d, %Y') if x['date'] != 'Unknown Date' else datetime.min, reverse=True)
+        news_items = []
+        for url, ts in listing:
+            result = fetched[url] if url in fetched else cache[url]['article']
+            if isinstance(result, Exception):
+                logging.error(f"Error processing article {url}: {result}")
+            elif result:
+                news_items.append(result)
+
+        # Drop articles that are no longer listed so the cache does not grow forever
+        save_json_file(NEWS_CACHE_FILE, {
+            'version': CACHE_VERSION,
+            'articles': {url: cache[url] for url, ts in listing if url in cache}
+        })
+
+        # Only advance the watermark once every listed article is safely cached
+        if all(url in cache for url, ts in listing):
+            timestamps = [ts for url, ts in listing if ts is not None]
+            save_json_file(NEWS_STATE_FILE, {'last_seen_max_ts': max(timestamps + [last_seen_max_ts])})
+
+        # Sort on the raw epoch timestamp rather than re-parsing the formatted date
+        news_items.sort(key=lambda x: x.get('_sort_ts', 0), reverse=True)
 
         logging.info("Successfully fetched and parsed news items.")
         return news_items
@@ -225,66 +296,74 @@ def fetch_news():
         return []
 
 
-def fetch_article_content(url):
+def parse_listing_timestamp(article):
+    date_element = article.find('span', class_='DateStr')
     try:
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(url)
-        response.raise_for_status()
+        return int(date_element.get('data')) if date_element else None
+    except (TypeError, ValueError):
+        return None
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        news_item = soup.find('div', class_='NewsItem')
-        if not news_item:
-            logging.warning(f"NewsItem not found for article URL: {url}")
-            return None
 
-        title_element = news_item.find('h1')
-        date_element = news_item.find('span', class_='DateStr')
-        author_element = news_item.find('div', class_='Author').find('strong')
-        content_div = news_item.find('div', class_='Content')
+def load_json_file(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (IOError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable file '{path}': {e}")
+        return {}
 
-        title = title_element.get_text(strip=True) if title_element else 'No Title'
-        date_str = date_element.get('data') if date_element else None
-        author = author_element.get_text(strip=True) if author_element else 'Unknown Author'
 
-        if date_str:
-            date_obj = datetime.utcfromtimestamp(int(date_str) / 1000)
-            formatted_date = date_obj.strftime('%B %d, %Y')
-        else:
-            logging.warning(f"Date not found for article at URL: {url}")
-            formatted_date = 'Unknown Date'
-
-        if content_div:
-            # Extract the content and handle images
-            content_html = ''
-            for element in content_div:
-                if element.name == 'img':
-                    src = element["src"]
-                    if not src.startswith("http"):
-                        src = f"http://www.gomotionapp.com{src}"
-                    content_html += f'<a href="{src}" target="_blank"><img src="{src}" style="max-width:100%; height:auto;" alt="Image"/></a>'
-                elif element.name and element.name.startswith('h'):
-                    # Flatten all heading tags to p tags with the same class for uniform size
-                    content_html += f'<p class="news-paragraph">{element.get_text(strip=True)}</p>'
-                elif element.name == 'a':
-                    href = element.get('href')
-                    text = element.get_text(strip=True)
-                    content_html += f'<a href="{href}" target="_blank">{text}</a>'
-                else:
-                    # Clean the element from unwanted attributes
-                    element.attrs = {}
-                    content_html += str(element)
-        else:
-            logging.warning(f"Content not found for article URL: {url}")
-            content_html = "Content not available."
+def save_json_file(path, data):
+    try:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2, sort_keys=True)
+    except IOError as e:
+        logging.error(f"Error saving '{path}': {e}")
 
-        return {
-            'title': title,
-            'date': formatted_date,
-            'summary': remove_duplicate_links(content_html),
-            'author': author
-        }
 
-    except requests.exceptions.RequestException as e:
+async def fetch_all_articles(urls, headers, cookies, cache):
+    if not urls:
+        return []
+
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_FETCHES)
+    # Downloads run on the event loop while the CPU-bound parsing runs in worker processes.
+    # Workers are spawned rather than forked because aiohttp's resolver threads are already running.
+    max_workers = min(len(urls), os.cpu_count() or 1)
+    mp_context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as process_pool:
+        async with aiohttp.ClientSession(headers=headers, cookies=cookies, connector=connector) as session:
+            tasks = [fetch_article_content(session, url, cache, process_pool) for url in urls]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fetch_article_content(session, url, cache, process_pool):
+    try:
+        cached = cache.get(url)
+        request_headers = {}
+        if cached:
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                request_headers['If-Modified-Since'] = cached['last_modified']
+
+        async with session.get(url, headers=request_headers) as response:
+            if response.status == 304 and cached:
+                logging.debug(f"Article unchanged, using cached copy: {url}")
+                return cached['article']
+            response.raise_for_status()
+            content = await response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        loop = asyncio.get_running_loop()
+        article = await loop.run_in_executor(process_pool, _parse_article_bytes, content, url)
+        if article:
+            cache[url] = {'etag': etag, 'last_modified': last_modified, 'article': article}
+        return article
+
+    except aiohttp.ClientError as e:
         logging.error(f"Error fetching article content from {url}: {e}")
         return {
             'title': 'Error fetching title',
@@ -302,120 +381,198 @@ def fetch_article_content(url):
         }
 
 
-def remove_duplicate_links(text):
-    soup = BeautifulSoup(text, 'html.parser')
+def _parse_article_bytes(content, url):
+    # Top-level so it can be pickled and run in a worker process
+    soup = BeautifulSoup(content, 'lxml', parse_only=_NEWSITEM_STRAINER)
+    news_item = soup.find('div', class_='NewsItem')
+    if not news_item:
+        logging.warning(f"NewsItem not found for article URL: {url}")
+        return None
+
+    title_element = news_item.find('h1')
+    date_element = news_item.find('span', class_='DateStr')
+    author_element = news_item.find('div', class_='Author').find('strong')
+    content_div = news_item.find('div', class_='Content')
+
+    title = title_element.get_text(strip=True) if title_element else 'No Title'
+    date_str = date_element.get('data') if date_element else None
+    author = author_element.get_text(strip=True) if author_element else 'Unknown Author'
+
+    if date_str:
+        date_obj = datetime.utcfromtimestamp(int(date_str) / 1000)
+        formatted_date = date_obj.strftime('%B %d, %Y')
+    else:
+        logging.warning(f"Date not found for article at URL: {url}")
+        formatted_date = 'Unknown Date'
+
+    if content_div:
+        clean_article_content(soup, content_div)
+        content_html = strip_article_attributes(content_div.decode_contents())
+    else:
+        logging.warning(f"Content not found for article URL: {url}")
+        content_html = "Content not available."
+
+    return {
+        'title': title,
+        'date': formatted_date,
+        'summary': content_html,
+        'author': author,
+        '_sort_ts': int(date_str) if date_str else 0
+    }
+
+
+def clean_article_content(soup, content_div):
+    # All formatting happens in place on the parsed tree; the caller serializes it once.
+    # Ensure all relative sources are prefixed with "www.gomotionapp.com"
+    for element in content_div.find_all(src=True):
+        if not element['src'].startswith('http'):
+            element['src'] = f"http://www.gomotionapp.com{element['src']}"
+
+    remove_duplicate_links(content_div)
+
+    # Convert images to "Click to see image" links
+    for img in content_div.find_all('img', src=True):
+        link = soup.new_tag('a', href=img['src'], target='_blank')
+        link.string = "Click to see image"
+        img.replace_with(link)
+
+    # Convert numbered and bulleted paragraphs into list items
+    current_list = None
+    for element in content_div.find_all(True, recursive=False):
+        text = element.get_text(strip=True)
+        is_bullet = text.startswith('* ')
+        if element.name in ('p', 'div') and (is_bullet or _RE_NUM_ITEM.match(text)):
+            if current_list is None:
+                current_list = soup.new_tag('ul')
+                element.insert_before(current_list)
+            if is_bullet:
+                first_text = next(s for s in element.strings if s.strip())
+                first_text.replace_with(first_text.lstrip()[2:])
+            element.name = 'li'
+            current_list.append(element.extract())
+        else:
+            current_list = None
+
+    return content_div
+
+
+def remove_duplicate_links(tag):
+    # Works on the live tree so no extra parse/serialize round trip is needed
     links = set()
-    for a in soup.find_all('a', href=True):
+    for a in tag.find_all('a', href=True):
         if a['href'] in links:
             a.decompose()
         else:
-            a.string = "Click here to be redirected to the link"
             links.add(a['href'])
-    return str(soup)
+            a.attrs = {'href': a['href'], 'target': '_blank'}
+            a.string = "Click here to be redirected to the link"
+    return tag
 
 
-def convert_links_to_clickable(text):
-    soup = BeautifulSoup(text, 'html.parser')
-    for a in soup.find_all('a', href=True):
-        if not a.string or a.string.strip() == "":
-            a.string = "Click here to be redirected to the link"
-        else:
-            a.string = "Click here to be redirected to the link"
-    return str(soup)
+def strip_article_attributes(content_html):
+    # lxml strips attributes across the whole fragment in C, far cheaper than walking it in Python
+    fragment = lxml.html.fragment_fromstring(content_html, create_parent='div')
+    lxml.etree.strip_attributes(fragment, *STRIPPED_ATTRIBUTES)
+
+    # Top-level elements lose every attribute, as before; links were already normalized to href/target
+    for child in fragment:
+        if isinstance(child.tag, str) and child.tag != 'a':
+            child.attrib.clear()
+
+    # Flatten all heading tags to p tags with the same class for uniform size
+    for heading in fragment.iter(*HEADING_TAGS):
+        heading.tag = 'p'
+        heading.set('class', 'news-paragraph')
+
+    return html.escape(fragment.text or '', quote=False) + ''.join(lxml.html.tostring(child, encoding='unicode') for child in fragment)
 
 
 def generate_html(news_items):
     logging.info("Generating HTML for news items...")
-    news_html = ''
+    parts = []
 
     for item in news_items:
-        summary_with_links = convert_links_to_clickable(item["summary"])
-        formatted_summary = format_summary(summary_with_links)
-        news_html += f'''
+        formatted_summary = format_summary(item["summary"])
+        parts.append(f'''
         <div class="news-item">
             <h2 class="news-title"><strong>{item["title"]}</strong></h2>
             <p class="news-date">Author: {item["author"]}</p>
             <p class="news-date">Published on {item["date"]}</p>
             <div class="news-content">{formatted_summary}</div>
         </div>
-        '''
+        ''')
 
     logging.info("Successfully generated HTML.")
-    return news_html
+    return ''.join(parts)
 
 
 def format_summary(summary):
-    try:
-        # Remove newlines and extra whitespace
-        summary = re.sub(r'\s*\n\s*', ' ', summary)
-        summary = re.sub(r'\s\s+', ' ', summary)
-
-        # Flatten any heading tags to paragraphs
-        summary = re.sub(r'<h[1-6][^>]*>', '<p class="news-paragraph">', summary)
-        summary = re.sub(r'</h[1-6]>', '</p>', summary)
-
-        # Remove any inline styles
-        summary = re.sub(r'style="[^"]*"', '', summary)
-
-        # Ensure all image links are prefixed with "www.gomotionapp.com"
-        summary = re.sub(r'src="/', 'src="http://www.gomotionapp.com/', summary)
-
-        # Convert newlines to <br> tags
-        summary = summary.replace('\n', '<br>')
-
-        # Convert numbered lists
-        summary = re.sub(r'(\d+)\. ', r'<li>\1. ', summary)
-        summary = re.sub(r'(<li>\d+\. [^<]+)<br>', r'\1</li>', summary)
-
-        # Convert bulleted lists
-        summary = re.sub(r'^\* ', r'<ul><li>', summary)
-        summary = re.sub(r'<br>\* ', r'</li><li>', summary)
-        summary = re.sub(r'(<li>[^<]+)<br>', r'\1</li>', summary)
-        summary = re.sub(r'(<li>[^<]+)$', r'\1</li></ul>', summary)
-
-        # Convert image links to "Click to see image" links
-        summary = re.sub(r'<img src="([^"]+)"[^>]*>', r'<a href="\1" target="_blank">Click to see image</a>', summary)
-
-        # Fix broken link formatting
-        summary = re.sub(r'<a href="([^"]+)">([^<]+)</a>', r'<a href="\1" target="_blank">\2</a>', summary)
-
-    except re.error as e:
-        logging.error(f"Regex error while formatting summary: {e}")
-        summary += "<br><em>Formatting error occurred. Displaying raw content.</em>"
-    except Exception as e:
-        logging.error(f"Unexpected error while formatting summary: {e}")
-        summary += "<br><em>Unexpected error occurred. Displaying raw content.</em>"
-
-    return summary
+    # Collapse newlines and runs of whitespace in one pass
+    return _RE_WS.sub(' ', summary)
 
 
 def update_html_file(news_html):
     try:
         if not os.path.exists(NEWS_HTML_FILE):
             logging.error(f"HTML file '{NEWS_HTML_FILE}' not found in the repository.")
-            return
+            return False
 
         logging.info("Updating HTML file...")
-        with open(NEWS_HTML_FILE, 'r', encoding='utf-8') as file:
-            content = file.read()
+        start_marker = b'<!-- START UNDER HERE -->'
+        end_marker = b'<!-- END AUTOMATION SCRIPT -->'
+        new_section = ('\n' + news_html + '\n').encode('utf-8')
+
+        with open(NEWS_HTML_FILE, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start_index = mm.find(start_marker)
+            end_index = mm.find(end_marker)
+
+            if start_index == -1 or end_index == -1:
+                logging.error("Markers not found in the HTML file.")
+                return False
+
+            start_index += len(start_marker)
+            if mm[start_index:end_index] == new_section:
+                logging.info("HTML file already up-to-date.")
+                return False
+
+            # Stream prefix, new section and suffix into a sibling file, then swap it in atomically
+            directory = os.path.dirname(os.path.abspath(NEWS_HTML_FILE))
+            with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as tmp:
+                try:
+                    copy_mmap_range(mm, tmp, 0, start_index)
+                    tmp.write(new_section)
+                    copy_mmap_range(mm, tmp, end_index, len(mm))
+                except Exception:
+                    tmp.close()
+                    os.remove(tmp.name)
+                    raise
+
+        try:
+            shutil.copymode(NEWS_HTML_FILE, tmp.name)
+            os.replace(tmp.name, NEWS_HTML_FILE)
+        except Exception:
+            os.remove(tmp.name)
+            raise
+        logging.info("Successfully updated HTML file.")
+        return True
 
-        start_marker = '<!-- START UNDER HERE -->'
-        end_marker = '<!-- END AUTOMATION SCRIPT -->'
-        start_index = content.find(start_marker) + len(start_marker)
-        end_index = content.find(end_marker)
+    except (IOError, ValueError) as e:
+        logging.error(f"Error updating HTML file: {e}")
+        return False
 
-        if start_index == -1 or end_index == -1:
-            logging.error("Markers not found in the HTML file.")
-            return
 
-        updated_content = content[:start_index] + '\n' + news_html + '\n' + content[end_index:]
+def copy_mmap_range(mm, out, start, end):
+    for offset in range(start, end, COPY_CHUNK_SIZE):
+        out.write(mm[offset:min(offset + COPY_CHUNK_SIZE, end)])
 
-        with open(NEWS_HTML_FILE, 'w', encoding='utf-8') as file:
-            file.write(updated_content)
-        logging.info("Successfully updated HTML file.")
 
-    except IOError as e:
-        logging.error(f"Error updating HTML file: {e}")
+def html_file_changed(repo):
+    # Diffing the one file we edit avoids a full-worktree status scan
+    try:
+        repo.git.diff('--quiet', 'HEAD', '--', NEWS_HTML_FILE)
+        return False
+    except GitCommandError:
+        return True
 
 
 def push_to_github():
@@ -427,17 +584,12 @@ def push_to_github():
         remote_url = f'https://{GITHUB_TOKEN}@github.com/dareaquatics/dare-website.git'
         repo.remotes.origin.set_url(remote_url)
 
-        if repo.is_dirty(untracked_files=True):
-            with tqdm(total=100, desc='Committing changes') as pbar:
-                def update_commit_pbar(cur_count, max_count=None, message=''):
-                    if max_count:
-                        pbar.total = max_count
-                    pbar.update(cur_count - pbar.n)
-                    pbar.set_postfix_str(message)
-
-                repo.git.add(NEWS_HTML_FILE)
-                repo.index.commit('automated commit: sync TeamUnify news articles [skip ci]')
-                pbar.update(100)
+        if html_file_changed(repo):
+            repo.git.add(NEWS_HTML_FILE)
+            for sidecar_file in (NEWS_CACHE_FILE, NEWS_STATE_FILE):
+                if os.path.exists(sidecar_file):
+                    repo.git.add(sidecar_file)
+            repo.index.commit('automated commit: sync TeamUnify news articles [skip ci]')
 
             origin = repo.remote(name='origin')
             with tqdm(total=100, desc='Pushing changes') as pbar:
@@ -479,9 +631,10 @@ def main():
 
         news_html = generate_html(news_items)
 
-        update_html_file(news_html)
-
-        push_to_github()
+        if update_html_file(news_html):
+            push_to_github()
+        else:
+            logging.info("News HTML unchanged. Skipping push.")
 
         logging.info("Update process completed.")
     except Exception as e: